@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import sys
 from types import ModuleType
 from typing import Dict, Mapping
@@ -26,35 +27,60 @@ EXAMPLE_STUB_MODULES: Dict[str, Mapping[str, object]] = {
     "service.debug": {"ENABLED": False},
 }
 
-_PACKAGE_NAMES = {
-    part
-    for name in EXAMPLE_STUB_MODULES
-    for part in (".".join(name.split(".")[:i]) for i in range(1, len(name.split("."))))
-    if part
-}
+def _build_stub_plan() -> tuple:
+    """Precompute a depth-ordered installation plan from the stub table.
 
+    Each name is split exactly once, and entries are sorted so that parent
+    packages always precede their children; ``ensure_example_stubs`` can then
+    install them in a single non-recursive pass.
+    """
 
-def _ensure_module(name: str, attrs: Mapping[str, object]) -> ModuleType:
-    module = sys.modules.get(name)
-    if module is None:
-        module = ModuleType(name)
-        if name in _PACKAGE_NAMES:
-            module.__path__ = []  # type: ignore[attr-defined]
-        sys.modules[name] = module
-    if attrs:
-        for key, value in attrs.items():
-            setattr(module, key, value)
-    if "." in name:
-        parent_name, _, child = name.rpartition(".")
-        parent = _ensure_module(parent_name, EXAMPLE_STUB_MODULES.get(parent_name, {}))
-        setattr(parent, child, module)
-        if parent_name in _PACKAGE_NAMES and not hasattr(parent, "__path__"):
-            parent.__path__ = []  # type: ignore[attr-defined]
-    return module
+    package_names = set()
+    entries = []
+    for name, attrs in EXAMPLE_STUB_MODULES.items():
+        parts = name.split(".")
+        for i in range(1, len(parts)):
+            package_names.add(".".join(parts[:i]))
+        if len(parts) > 1:
+            parent_name, child_attr = ".".join(parts[:-1]), parts[-1]
+        else:
+            parent_name = child_attr = None
+        entries.append((len(parts), name, parent_name, child_attr, attrs))
+    entries.sort(key=lambda entry: entry[0])
+    return frozenset(package_names), tuple(entry[1:] for entry in entries)
+
+
+_PACKAGE_NAMES, _STUB_PLAN = _build_stub_plan()
 
 
 def ensure_example_stubs() -> None:
     """Ensure stub modules referenced by bundled examples are importable."""
 
-    for name, attrs in EXAMPLE_STUB_MODULES.items():
-        _ensure_module(name, attrs)
+    modules = sys.modules
+    if all(name in modules for name, _, __, ___ in _STUB_PLAN):
+        # Everything is already installed; avoid re-applying attributes. This
+        # stays correct even if individual stubs were removed (e.g. by tests).
+        return
+
+    for name, parent_name, child_attr, attrs in _STUB_PLAN:
+        module = modules.get(name)
+        if module is None:
+            module = ModuleType(name)
+            if name in _PACKAGE_NAMES:
+                module.__path__ = []  # type: ignore[attr-defined]
+            modules[name] = module
+        for key, value in attrs.items():
+            setattr(module, key, value)
+        if parent_name is not None:
+            # The plan is depth-ordered and every parent is in the stub table,
+            # so the parent module is guaranteed to exist by now.
+            parent = modules[parent_name]
+            setattr(parent, child_attr, module)
+            if not hasattr(parent, "__path__"):
+                parent.__path__ = []  # type: ignore[attr-defined]
+
+
+if os.environ.get("LOGURU_CONFIG_EAGER_STUBS") == "1":
+    # Opt-in: install the stubs as soon as this module is imported, so later
+    # ``ensure_example_stubs`` calls hit the already-installed fast path.
+    ensure_example_stubs()
@@ -53,12 +53,12 @@ class ParsableConfiguration:
     parser.
     """
 
-    supported_loaders: Collection[Callable[[str], dict]] = [
+    supported_loaders: Collection[Callable[[str], dict]] = (
         load_json_config,
         load_yaml_config,
         load_json5_config,
         load_toml_config
-    ]
+    )
 
     def __init__(self, **kwargs):
         self.__dict__.update(kwargs)
@@ -1,30 +1,98 @@
-def load_toml_config(config_str: str) -> dict:
-    import tomlkit
+from functools import cache
+
+
+@cache
+def _accel():
+    # Optional native accelerator (a PyO3/serde extension distributed
+    # separately as ``loguru_config_ext``); used opportunistically when it is
+    # installed, with the pure-Python loaders as the fallback.
+    try:
+        import loguru_config_ext
+    except ImportError:
+        return None
+    return loguru_config_ext
+
+
+@cache
+def _rtoml():
+    # ``rtoml`` parses in native code and is substantially faster than any
+    # pure-Python TOML parser, so prefer it when it happens to be installed.
+    try:
+        import rtoml
+    except ImportError:
+        return None
+    return rtoml
+
+
+@cache
+def _tomllib():
+    import tomllib
+    return tomllib
+
+
+@cache
+def _yaml():
+    import yaml
+    return yaml
+
 
-    def _unwrap(value):
-        if hasattr(value, "unwrap"):
-            value = value.unwrap()
+@cache
+def _yaml_safe_loader():
+    # PyYAML only uses the C-accelerated loader when asked explicitly;
+    # the pure-Python SafeLoader is several times slower.
+    yaml = _yaml()
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-        if isinstance(value, dict):
-            return {k: _unwrap(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [_unwrap(v) for v in value]
-        return value
 
-    document = tomlkit.loads(config_str)
-    return _unwrap(document)
+@cache
+def _pyjson5():
+    import pyjson5
+    return pyjson5
+
+
+@cache
+def _orjson():
+    # orjson parses and serializes JSON several times faster than stdlib
+    # json; use it opportunistically when installed.
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def load_toml_config(config_str: str) -> dict:
+    accel = _accel()
+    if accel is not None and hasattr(accel, "loads_toml"):
+        return accel.loads_toml(config_str)
+
+    rtoml = _rtoml()
+    if rtoml is not None:
+        return rtoml.loads(config_str)
+
+    # ``tomllib`` already returns plain dicts/lists/scalars, so no
+    # style-preserving wrappers need to be unwrapped afterwards.
+    return _tomllib().loads(config_str)
 
 
 def load_json_config(config_str: str) -> dict:
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(config_str)
     import json
     return json.loads(config_str)
 
 
 def load_yaml_config(config_str: str) -> dict:
-    import yaml
-    return yaml.safe_load(config_str)
+    return _yaml().load(config_str, Loader=_yaml_safe_loader())
 
 
 def load_json5_config(config_str: str) -> dict:
-    import pyjson5
-    return pyjson5.loads(config_str)
+    # Most configurations are plain JSON even when routed through the JSON5
+    # loader; stdlib json is far faster, so probe it before pyjson5.
+    import json
+    try:
+        return json.loads(config_str)
+    except ValueError:
+        pass
+    return _pyjson5().loads(config_str)
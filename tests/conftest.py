@@ -0,0 +1,9 @@
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    # CliRunner keeps no state between invocations, so a single instance
+    # serves the whole session (one per pytest-xdist worker).
+    return CliRunner()